@@ -5,7 +5,8 @@
 Various helpers for dealing with Deferred APIs in flocker.
 """
 
-from twisted.internet.defer import gatherResults
+from twisted.internet.defer import Deferred, FirstError, succeed
+from twisted.python.failure import Failure
 
 from eliot import write_failure
 
@@ -18,7 +19,7 @@ def gather_deferreds(deferreds):
     Any errback in the supplied ``deferreds`` will be handled and logged
     with a call to ``twisted.python.log.err``.
 
-    See ``twisted.internet.defer.gatherResults`` which this function wraps.
+    This provides the same results as ``twisted.internet.defer.gatherResults``.
 
     :param list deferreds: A ``list`` of ``Deferred``\ s whose results will
         be gathered.
@@ -29,10 +30,45 @@ def gather_deferreds(deferreds):
         ``FirstError`` failure containing a reference to the failure produced
         by the first of the ``deferreds`` to fail.
     """
-    # Gather once to get the results OR the first failure
-    results_or_first_failure = gatherResults(deferreds)
+    if not deferreds:
+        return succeed([])
 
-    def log_and_discard(failure):
+    # Rather than building a ``DeferredList`` (which allocates a
+    # ``(success, result)`` pair per input and then needs another pass to
+    # unpack them), write each result straight into its slot and count down
+    # until everything has fired.
+    results = [None] * len(deferreds)
+    pending = [len(deferreds)]
+    # The first failure (in the order the failures happen) is remembered so
+    # that the ``FirstError`` semantics of ``gatherResults`` can be provided.
+    first_failure = []
+    gathering = Deferred()
+
+    def one_fired():
+        """
+        Account for one more of the ``deferreds`` having fired and fire
+        ``gathering`` once they all have.
+        """
+        pending[0] -= 1
+        if pending[0] == 0:
+            if first_failure:
+                gathering.errback(first_failure[0])
+            else:
+                gathering.callback(results)
+
+    def record_result(result, index):
+        """
+        Record a successful result.
+
+        :param result: The result of one of the ``deferreds``.
+        :param int index: The position of that ``Deferred`` in ``deferreds``.
+        :return: ``result``, unchanged.
+        """
+        results[index] = result
+        one_fired()
+        return result
+
+    def log_and_discard(failure, index):
         """
         Log the supplied failure and discard it.
 
@@ -41,16 +77,27 @@ def gather_deferreds(deferreds):
         collected.
 
         :param Failure failure: The ``Failure`` to be logged.
+        :param int index: The position of the failed ``Deferred`` in
+            ``deferreds``.
         """
         write_failure(failure)
+        if not first_failure:
+            first_failure.append(FirstError(failure, index))
+        one_fired()
 
-    for deferred in deferreds:
-        deferred.addErrback(log_and_discard)
-
-    # After adding logging callbacks, gather again so as to wait for all
-    # the supplied deferreds to fire.
-    gathering = gatherResults(deferreds)
-
-    # Then return the result of the first gather.
-    gathering.addCallback(lambda ignored: results_or_first_failure)
+    for index, deferred in enumerate(deferreds):
+        if (deferred.called and not deferred.paused and
+                not deferred.callbacks and not deferred._runningCallbacks and
+                not isinstance(deferred.result, Failure)):
+            # This one has finished running its callbacks with a successful
+            # result and can never fail now, so just take its result rather
+            # than adding callbacks to it.  If its callbacks are still running
+            # (for example because this is being called from one of them) the
+            # current result is only an intermediate one.
+            record_result(deferred.result, index)
+        else:
+            deferred.addCallbacks(
+                record_result, log_and_discard,
+                callbackArgs=(index,), errbackArgs=(index,),
+            )
     return gathering
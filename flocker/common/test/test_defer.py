@@ -79,6 +79,31 @@ class GatherDeferredsTests(TestCase):
         results = self.successResultOf(d)
         self.assertEqual([expected_result1, expected_result2], results)
 
+    def test_success_out_of_order(self):
+        """
+        The successful results are returned in the order of the supplied
+        ``deferreds``, regardless of the order in which they fire.
+        """
+        expected_result1 = object()
+        expected_result2 = object()
+        d1 = Deferred()
+        d2 = Deferred()
+        gathering = gather_deferreds([d1, d2])
+
+        d2.callback(expected_result2)
+        d1.callback(expected_result1)
+
+        self.assertEqual(
+            [expected_result1, expected_result2],
+            self.successResultOf(gathering),
+        )
+
+    def test_no_deferreds(self):
+        """
+        If no ``deferreds`` are supplied the result is an empty ``list``.
+        """
+        self.assertEqual([], self.successResultOf(gather_deferreds([])))
+
     @capture_logging(
         lambda self, logger: logger.flush_tracebacks(ZeroDivisionError)
     )
@@ -108,7 +133,10 @@ class GatherDeferredsTests(TestCase):
         d = gather_deferreds([fail(failure1), succeed(None), fail(failure2)])
 
         first_error = self.failureResultOf(d, FirstError)
-        self.assertIs(first_error.value.subFailure, failure1)
+        self.assertEqual(
+            (failure1, 0),
+            (first_error.value.subFailure, first_error.value.index),
+        )
 
     @capture_logging(
         lambda self, logger: logger.flush_tracebacks(ZeroDivisionError)
@@ -158,3 +186,51 @@ class GatherDeferredsTests(TestCase):
         del d1, d2, d3
         gc.collect()
         self.assertEqual([], logger.flush_tracebacks(ZeroDivisionError))
+
+    @capture_logging(None)
+    def test_paused_deferred_failure(self, logger):
+        """
+        A supplied ``Deferred`` which has fired but is still waiting on the
+        result of another ``Deferred`` is treated as not having fired yet: if
+        that result turns out to be a failure, it is logged and reported.
+        """
+        inner = Deferred()
+        outer = succeed(None)
+        outer.addCallback(lambda ignored: inner)
+        gathering = gather_deferreds([outer, succeed(None)])
+
+        expected_error = ZeroDivisionError()
+        inner.errback(expected_error)
+
+        self.assertEqual(
+            [expected_error],
+            list(f["reason"]
+                 for f in logger.flush_tracebacks(ZeroDivisionError)),
+        )
+        self.failureResultOf(gathering, FirstError)
+
+    @capture_logging(None)
+    def test_called_from_callback(self, logger):
+        """
+        If ``gather_deferreds`` is called from a callback of one of the
+        supplied ``deferreds``, a failure from a later callback of that
+        ``Deferred`` is logged and reported.
+        """
+        d = Deferred()
+        gatherings = []
+
+        def gather(result):
+            gatherings.append(gather_deferreds([d]))
+            return result
+
+        def raise_error(ignored):
+            raise ZeroDivisionError()
+
+        d.addCallback(gather)
+        d.addCallback(raise_error)
+        d.callback(5)
+
+        self.assertEqual(
+            1, len(logger.flush_tracebacks(ZeroDivisionError))
+        )
+        self.failureResultOf(gatherings[0], FirstError)
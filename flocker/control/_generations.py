@@ -14,6 +14,9 @@ from ._persistence import make_generation_hash
 from ._diffing import Diff, create_diff, compose_diffs
 
 
+_UNCACHED_SENTINEL = object()
+
+
 class _GenerationRecord(PClass):
     """
     Helper object that stores a specific generation of an object and a Diff to
@@ -44,6 +47,9 @@ class GenerationTracker(object):
         version.
     :ivar _latest_object: The most recent version of the object being tracked.
     :ivar _latest_hash: The most recent hash of the object being tracked.
+    :ivar dict _diff_cache: A mapping from generation hashes to the result of
+        ``get_diff_from_hash_to_latest`` for that hash.  It is cleared whenever
+        a new latest version of the object is inserted.
     """
 
     def __init__(self, cache_size):
@@ -57,6 +63,7 @@ class GenerationTracker(object):
         self._queue = deque(maxlen=cache_size)
         self._latest_object = None
         self._latest_hash = None
+        self._diff_cache = {}
 
     def get_latest(self):
         """
@@ -99,6 +106,7 @@ class GenerationTracker(object):
 
         self._latest_object = latest
         self._latest_hash = latest_hash
+        self._diff_cache = {}
 
     def get_diff_from_hash_to_latest(self, generation_hash):
         """
@@ -115,6 +123,26 @@ class GenerationTracker(object):
         if generation_hash is None:
             return None
 
+        # Many agents are usually at the same generation.  Remembering the
+        # result avoids composing the diff again for every connection.  It
+        # also means the wire encoding cache is always looked up with the
+        # very same ``Diff`` object, which the lookup matches by identity
+        # rather than by comparing it against an equal but distinct ``Diff``.
+        cached = self._diff_cache.get(generation_hash, _UNCACHED_SENTINEL)
+        if cached is not _UNCACHED_SENTINEL:
+            return cached
+
+        result = self._compute_diff_from_hash_to_latest(generation_hash)
+        self._diff_cache[generation_hash] = result
+        return result
+
+    def _compute_diff_from_hash_to_latest(self, generation_hash):
+        """
+        Compute the diff from a previous version of the object to the latest
+        version of the object, without consulting the cache.
+
+        See ``get_diff_from_hash_to_latest`` for parameters and return value.
+        """
         if self._latest_hash == generation_hash:
             return compose_diffs([])
 
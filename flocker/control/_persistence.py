@@ -7,7 +7,7 @@ Persistence of cluster configuration.
 from base64 import b16encode
 from calendar import timegm
 from datetime import datetime
-from json import dumps, loads
+from json import JSONDecoder, dumps, loads
 from mmh3 import hash_bytes as mmh3_hash_bytes
 from uuid import UUID
 from collections import Set, Mapping, Iterable
@@ -463,30 +463,65 @@ def wire_encode(obj):
     return dumps(_cached_dfs_serialize(obj))
 
 
+def _model_class_decoder(cls):
+    """
+    Create a decoder for one of the ``SERIALIZABLE_CLASSES``.
+
+    :param cls: The model class to create instances of.
+    :return: A one-argument callable suitable for ``_WIRE_DECODERS``.
+    """
+    def decode(dictionary):
+        # The dictionary was freshly created by the JSON decoder and nothing
+        # else refers to it, so it is safe to remove the marker in place
+        # rather than copying it first.
+        del dictionary[_CLASS_MARKER]
+        return cls.create(dictionary)
+    return decode
+
+
+# Map of class markers to the function which turns a decoded JSON
+# dictionary carrying that marker back into an object.  A single dictionary
+# lookup is cheaper than walking a chain of comparisons for every object in
+# a (potentially very large) encoded configuration or state.
+_WIRE_DECODERS = {
+    u"FilePath": lambda d: FilePath(d[u"path"].encode("utf-8")),
+    u"PMap": lambda d: pmap(d[u"values"]),
+    u"UUID": lambda d: UUID(d[u"hex"]),
+    u"datetime": lambda d: datetime.fromtimestamp(d[u"seconds"], UTC),
+}
+_WIRE_DECODERS.update(
+    (class_name, _model_class_decoder(cls))
+    for class_name, cls in _CONFIG_CLASS_MAP.items()
+)
+
+
+def _decode_object(dictionary):
+    """
+    JSON ``object_hook`` which reconstructs model objects from dictionaries
+    produced by ``wire_encode``.
+
+    :param dict dictionary: A decoded JSON object.
+    :return: The corresponding model object, or ``dictionary`` unchanged if
+        it does not carry a known class marker.
+    """
+    decoder = _WIRE_DECODERS.get(dictionary.get(_CLASS_MARKER))
+    if decoder is None:
+        return dictionary
+    return decoder(dictionary)
+
+
+# ``loads`` builds a new decoder (and scanner) on every call when given an
+# ``object_hook``, so build the one used for the wire format just once.
+_wire_decoder = JSONDecoder(object_hook=_decode_object)
+
+
 def wire_decode(data):
     """
     Decode the given model object from bytes.
 
     :param bytes data: Encoded object.
     """
-    def decode(dictionary):
-        class_name = dictionary.get(_CLASS_MARKER, None)
-        if class_name == u"FilePath":
-            return FilePath(dictionary.get(u"path").encode("utf-8"))
-        elif class_name == u"PMap":
-            return pmap(dictionary[u"values"])
-        elif class_name == u"UUID":
-            return UUID(dictionary[u"hex"])
-        elif class_name == u"datetime":
-            return datetime.fromtimestamp(dictionary[u"seconds"], UTC)
-        elif class_name in _CONFIG_CLASS_MAP:
-            dictionary = dictionary.copy()
-            dictionary.pop(_CLASS_MARKER)
-            return _CONFIG_CLASS_MAP[class_name].create(dictionary)
-        else:
-            return dictionary
-
-    return loads(data, object_hook=decode)
+    return _wire_decoder.decode(data)
 
 
 def to_unserialized_json(obj):
@@ -33,11 +33,11 @@ http://eliot.readthedocs.org/en/0.6.0/threads.html).
 
 from collections import defaultdict
 from datetime import timedelta
-from io import BytesIO
 from itertools import count
 from twisted.internet.defer import maybeDeferred
 from uuid import UUID
 from functools import partial
+from weakref import WeakKeyDictionary
 
 from eliot import (
     Logger, ActionType, Action, Field, MessageType,
@@ -48,8 +48,6 @@ from pyrsistent import PClass, field
 
 from repoze.lru import LRUCache
 
-from characteristic import with_cmp
-
 from zope.interface import Interface, Attribute
 
 from twisted.application.service import Service
@@ -100,14 +98,16 @@ class Big(Argument):
         See ``IArgumentType`` for argument and return type documentation.
         """
         self.another_argument.toBox(name, strings, objects, proto)
-        value = BytesIO(strings.pop(name))
-        counter = 0
-        while True:
-            nextChunk = value.read(MAX_VALUE_LENGTH)
-            if not nextChunk:
-                break
-            strings["%s.%d" % (name, counter)] = nextChunk
-            counter += 1
+        value = strings.pop(name)
+        # Slice the value rather than reading it through a ``BytesIO``: that
+        # would copy the whole (potentially very large) value up front and
+        # then copy every chunk again.  Slicing copies each byte at most once
+        # and a value which fits in a single chunk is not copied at all.
+        offsets = xrange(0, len(value), MAX_VALUE_LENGTH)
+        for counter, offset in enumerate(offsets):
+            strings["%s.%d" % (name, counter)] = value[
+                offset:offset + MAX_VALUE_LENGTH
+            ]
 
     def fromBox(self, name, strings, objects, proto):
         """
@@ -120,14 +120,17 @@ class Big(Argument):
 
         See ``IArgumentType`` for argument and return type documentation.
         """
-
-        value = BytesIO()
+        chunks = []
         for counter in count(0):
             chunk = strings.get("%s.%d" % (name, counter))
             if chunk is None:
                 break
-            value.write(chunk)
-            strings[name] = value.getvalue()
+            chunks.append(chunk)
+        if chunks:
+            # Join once at the end rather than re-copying the accumulated
+            # value after every chunk.  Joining a single chunk (the common
+            # case) returns it without copying.
+            strings[name] = b"".join(chunks)
         self.another_argument.fromBox(name, strings, objects, proto)
 
 
@@ -184,14 +187,16 @@ class SerializableArgument(Argument):
         return caching_wire_encode(obj)
 
 
-class _EliotActionArgument(Unicode):
+class _EliotActionArgument(Argument):
     """
     AMP argument that serializes/deserializes Eliot actions.
+
+    Serialized Eliot task identifiers are ASCII ``bytes`` and that is what
+    ``Action.continue_task`` expects, so they are passed through as-is rather
+    than being decoded to ``unicode`` and back on every command.
     """
     def fromStringProto(self, inString, proto):
-        return Action.continue_task(
-            proto.logger,
-            Unicode.fromStringProto(self, inString, proto))
+        return Action.continue_task(proto.logger, inString)
 
     def toString(self, inObject):
         return inObject.serialize_task_id()
@@ -509,6 +514,12 @@ LOG_SEND_CLUSTER_STATE = ActionType(
     "Send the configuration and state of the cluster to all agents.")
 
 
+# The peer of a connection never changes, but it is logged for every update
+# sent to the agent on the other end.  Remember the serialized form for as
+# long as the connection is around rather than recomputing it every time.
+_serialized_agent_cache = WeakKeyDictionary()
+
+
 def _serialize_agent(controlamp):
     """
     Serialize a connected ``ControlAMP`` to the address of its peer.
@@ -518,7 +529,11 @@ def _serialize_agent(controlamp):
 
     :rtype str:
     """
-    return str(controlamp.transport.getPeer())
+    result = _serialized_agent_cache.get(controlamp)
+    if result is None:
+        result = str(controlamp.transport.getPeer())
+        _serialized_agent_cache[controlamp] = result
+    return result
 
 
 AGENT = Field(
@@ -723,12 +738,21 @@ class ControlAMPService(Service):
                 action.add_success_fields(
                     configuration=configuration, state=state
                 )
+                # Set the configuration and the state to the latest versions
+                # once for the whole batch rather than once per connection;
+                # this compares against, and possibly hashes and diffs, the
+                # previous versions.  It is okay to call this even if the
+                # latest configuration is the same object.
+                self._configuration_generation_tracker.insert_latest(
+                    configuration
+                )
+                self._state_generation_tracker.insert_latest(state)
             else:
                 # Eliot wants those fields though.
                 action.add_success_fields(configuration=None, state=None)
 
             for connection in can_update:
-                self._update_connection(connection, configuration, state)
+                self._update_connection(connection)
 
             for connection in elided_update:
                 AGENT_UPDATE_ELIDED(agent=connection).write()
@@ -736,20 +760,16 @@ class ControlAMPService(Service):
             for connection in delayed_update:
                 self._delayed_update_connection(connection)
 
-    def _update_connection(self, connection, configuration, state):
+    def _update_connection(self, connection):
         """
         Send the latest cluster configuration and state to ``connection``.
 
+        The generation trackers must already have been updated with the
+        latest configuration and state.
+
         :param ControlAMP connection: The connection to use to send the
             command.
         """
-
-        # Set the configuration and the state to the latest versions. It is
-        # okay to call this even if the latest configuration is the same
-        # object.
-        self._configuration_generation_tracker.insert_latest(configuration)
-        self._state_generation_tracker.insert_latest(state)
-
         action = LOG_SEND_TO_AGENT(agent=connection)
         with action.context():
 
@@ -897,7 +917,7 @@ class ControlAMPService(Service):
         :param connections: An iterable of connections that will be passed to
             ``_send_state_to_connections``.
         """
-        self._connections_pending_update.update(set(connections))
+        self._connections_pending_update.update(connections)
 
         # If there is no current pending update and there are connections
         # pending an update, we must schedule the delayed call to update
@@ -969,7 +989,6 @@ class IConvergenceAgent(Interface):
         """
 
 
-@with_cmp(["agent"])
 class _AgentLocator(CommandLocator):
     """
     Command locator for convergence agent.
@@ -1002,6 +1021,20 @@ class _AgentLocator(CommandLocator):
         self._timeout.reset()
         return CommandLocator.locateResponder(self, name)
 
+    def __eq__(self, other):
+        if isinstance(other, _AgentLocator):
+            return self.agent == other.agent
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return hash(self.agent)
+
     @NoOp.responder
     def noop(self):
         """
@@ -99,3 +99,41 @@ class GenerationTrackerTests(TestCase):
             missing_diff,
             Is(None)
         )
+
+    def test_diff_reused(self):
+        """
+        Repeated calls to ``get_diff_from_hash_to_latest`` with the same
+        generation hash return the same ``Diff`` object, so that its
+        serialization can be shared by every connection it is sent to.
+        """
+        deployments = related_deployments_strategy(3).example()
+        tracker_under_test = GenerationTracker(10)
+        for d in deployments:
+            tracker_under_test.insert_latest(d)
+
+        first_hash = make_generation_hash(deployments[0])
+        self.assertThat(
+            tracker_under_test.get_diff_from_hash_to_latest(first_hash),
+            Is(tracker_under_test.get_diff_from_hash_to_latest(first_hash))
+        )
+
+    def test_diff_cache_invalidated(self):
+        """
+        After a new latest object is inserted, ``get_diff_from_hash_to_latest``
+        returns a diff to the new latest object rather than a previously
+        returned one.
+        """
+        deployments = list(related_deployments_strategy(3).example())
+        tracker_under_test = GenerationTracker(10)
+        for d in deployments[:2]:
+            tracker_under_test.insert_latest(d)
+
+        first_hash = make_generation_hash(deployments[0])
+        tracker_under_test.get_diff_from_hash_to_latest(first_hash)
+        tracker_under_test.insert_latest(deployments[2])
+        diff = tracker_under_test.get_diff_from_hash_to_latest(first_hash)
+
+        self.assertThat(
+            diff.apply(deployments[0]),
+            Equals(deployments[2])
+        )
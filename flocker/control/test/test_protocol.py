@@ -1456,6 +1456,25 @@ class AgentLocatorTests(TestCase):
             agent=fake_agent, timeout=timeout_for_protocol(reactor, protocol))
         self.assertIs(logger, locator.logger)
 
+    def test_equality(self):
+        """
+        ``_AgentLocator`` instances are equal, and hash equally, if and only if
+        they are for the same agent.
+        """
+        reactor = Clock()
+        agent = FakeAgent()
+        protocol = AgentAMP(reactor, agent)
+
+        def locator(agent):
+            return _AgentLocator(
+                agent=agent, timeout=timeout_for_protocol(reactor, protocol))
+
+        self.assertTrue(locator(agent) == locator(agent))
+        self.assertFalse(locator(agent) != locator(agent))
+        self.assertEqual(hash(locator(agent)), hash(locator(agent)))
+        self.assertNotEqual(
+            locator(agent), locator(FakeAgent(desired=object())))
+
 
 class ControlServiceLocatorTests(TestCase):
     """